@@ -1,5 +1,5 @@
 import gfapy
-import re
+from .printable import PRINTABLE, PRINTABLE_WS, only_chars
 
 def unsafe_decode(string):
   return string.split(" ")
@@ -9,13 +9,24 @@ def decode(string):
   return unsafe_decode(string)
 
 def validate_encoded(string):
-  if not re.match("^[ !-~]+$", string):
+  if not only_chars(string, PRINTABLE_WS):
     raise gfapy.FormatError(
       "{} is not a valid list of GFA2 identifier\n".format(repr(string))+
       "(it contains non-printable characters)")
 
+def _all_identifiers(names):
+  # bulk check of a list of strings, using only C-level string operations:
+  # the space-joined list must consist of printable characters and spaces,
+  # contain exactly one space per separator and no empty identifier
+  if not names or "" in names:
+    return False
+  joined = " ".join(names)
+  return only_chars(joined, PRINTABLE_WS) and \
+      joined.count(" ") == len(names) - 1
+
 def validate_decoded(obj):
   if isinstance(obj, list):
+    names = []
     for elem in obj:
       if isinstance(elem, gfapy.Line):
         elem = str(elem.name)
@@ -24,7 +35,12 @@ def validate_decoded(obj):
           "the list contains an obj of class {}\n"
           .format(elem.__class__.__name__)+
           "(accepted classes: str, gfapy.Line)")
-      if not re.match("^[!-~]+$", elem):
+      names.append(elem)
+    if _all_identifiers(names):
+      return
+    # find the first invalid identifier, for the error message
+    for elem in names:
+      if not only_chars(elem, PRINTABLE):
         raise gfapy.FormatError(
         "the list contains an invalid GFA2 identifier ({})\n"
         .format(repr(elem))+
@@ -35,19 +51,19 @@ def validate_decoded(obj):
       .format(obj.__class__.__name__) +
       "(accepted classes: list)")
 
+def _line_name(elem):
+  if isinstance(elem, gfapy.Line):
+    return str(elem.name)
+  else:
+    raise gfapy.TypeError(
+      "the list contains an obj of class {}\n"
+      .format(elem.__class__.__name__)+
+      "(accepted classes: str, gfapy.Line)")
+
 def unsafe_encode(obj):
   if isinstance(obj, list):
-    def func(elem):
-      if isinstance(elem, str):
-        return elem
-      elif isinstance(elem, gfapy.Line):
-        return str(elem.name)
-      else:
-        raise gfapy.TypeError(
-          "the list contains an obj of class {}\n"
-          .format(elem.__class__.__name__)+
-          "(accepted classes: str, gfapy.Line)")
-    return " ".join(map(func, obj))
+    return " ".join([elem if isinstance(elem, str) else _line_name(elem)
+                     for elem in obj])
   elif isinstance(obj, str):
     return obj
   else:
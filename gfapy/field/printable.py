@@ -0,0 +1,28 @@
+"""
+Fast checks for strings consisting only of printable ASCII characters.
+"""
+
+PRINTABLE = bytes(range(0x21, 0x7F))
+"""Printable ASCII characters, space excluded (GFA2 identifiers)."""
+
+PRINTABLE_WS = bytes(range(0x20, 0x7F))
+"""Printable ASCII characters, space included."""
+
+def only_chars(string, allowed):
+  """Checks that a string is non-empty and all its characters are allowed.
+
+  Deleting the allowed bytes from the ASCII-encoded string leaves an empty
+  remainder if and only if all characters are allowed.
+
+  Parameters:
+    string (str) : the string to check
+    allowed (bytes) : the allowed characters, e.g. PRINTABLE
+
+  Returns:
+    bool
+  """
+  try:
+    encoded = string.encode("ascii")
+  except UnicodeEncodeError:
+    return False
+  return len(encoded) > 0 and not encoded.translate(None, allowed)
@@ -46,18 +46,19 @@ class LinearPaths:
     for sn in segnames:
       if self._progress:
         self._progress_log("linear_paths")
+      if redundant_junctions:
+        retval += self._junction_junction_paths(sn, junction_exclude)
       if sn in exclude:
         continue
       lp = self.linear_path(sn, exclude)
       if not redundant_junctions:
         if len(lp) > 1:
           retval.append(lp)
-      else:
-        if lp:
-          self._extend_linear_path_to_junctions(lp)
+      elif lp:
+        self._extend_linear_path_to_junctions(lp)
+        # the two ends of the path are the redundancy flags
+        if len(lp) > 3:
           retval.append(lp)
-        else:
-          retval += self._junction_junction_paths(sn, junction_exclude)
     if self._progress:
       self._progress_log_end("linear_paths")
     return retval
@@ -214,7 +215,10 @@ class LinearPaths:
       else:
         o = segment.get("or")
     if init:
-      merged.sequence = [s]
+      if gfapy.is_placeholder(segment.sequence):
+        merged.sequence = gfapy.Placeholder()
+      else:
+        merged.sequence = [s]
       if merged_name:
         merged.name = [merged_name]
       else:
@@ -227,7 +231,7 @@ class LinearPaths:
     else:
       if gfapy.is_placeholder(segment.sequence):
         merged.sequence = gfapy.Placeholder()
-      else:
+      elif not gfapy.is_placeholder(merged.sequence):
         merged.sequence.append(s)
       if not merged_name:
         merged.name.append(n)
@@ -3,33 +3,59 @@ import gfapy
 class RedundantLinearPaths:
 
   def _junction_junction_paths(self, sn, exclude):
-    retval = []
+    # paths of two segments, connected by a dovetail overlap between two
+    # junction ends (ends with multiple dovetail overlaps); overlaps where
+    # only one of the two ends is a junction are already included in the
+    # linear paths, by _extend_linear_path_to_junctions
     exclude.add(sn)
     s = self.segment(sn)
-    for dL in s.dovetails_L:
-      eL = dL.other_end(gfapy.SegmentEnd(s, "L"))
-      if (eL.name in exclude) or (len(eL.segment.dovetails_of_end(eL.end_type)) == 1):
-        retval.append([True, eL, gfapy.SegmentEnd(s, "R"), True])
-    for dR in s.dovetails_R:
-      eR = dR.other_end(gfapy.SegmentEnd(s, "R"))
-      if (eR.name in exclude) or (len(eR.segment.dovetails_of_end(eR.end_type)) == 1):
-        retval.append([True, gfapy.SegmentEnd(s, "R"), eR.inverted(), True])
+    sl = gfapy.SegmentEnd(s, "L")
+    sr = gfapy.SegmentEnd(s, "R")
+    retval = []
+    append = retval.append
+    if len(s.dovetails_L) > 1:
+      for dL in s.dovetails_L:
+        eL = dL.other_end(sl)
+        if (eL.name not in exclude) and \
+            (len(eL.segment.dovetails_of_end(eL.end_type)) > 1):
+          append([True, eL, sr, True])
+    if len(s.dovetails_R) > 1:
+      for dR in s.dovetails_R:
+        eR = dR.other_end(sr)
+        if (eR.name not in exclude) and \
+            (len(eR.segment.dovetails_of_end(eR.end_type)) > 1):
+          append([True, sr, eR.inverted(), True])
     return retval
 
   def _extend_linear_path_to_junctions(self, segpath):
-    segfirst = self.segment(segpath[0].segment)
-    segfirst_d = segfirst.dovetails_of_end(gfapy.invert(segpath[0].end_type))
-    redundant_first = (len(segfirst_d) > 0)
-    if len(segfirst_d) == 1:
-      segpath.insert(0, segfirst_d[0].other_end(segpath[0].inverted()))
+    # a path end is redundant if it is a junction end (an end with multiple
+    # dovetail overlaps), or if the path can be extended to the junction end
+    # of a segment which is not already in the path; otherwise (e.g. in
+    # circular components) the path end is not redundant
+    names = {sn_et.name for sn_et in segpath}
+    first_d = self.segment(segpath[0].segment).dovetails_of_end(
+                gfapy.invert(segpath[0].end_type))
+    redundant_first = (len(first_d) > 1)
+    if len(first_d) == 1:
+      junction = first_d[0].other_end(segpath[0].inverted())
+      if self.__is_junction_end(junction) and junction.name not in names:
+        segpath.insert(0, junction)
+        redundant_first = True
     segpath.insert(0, redundant_first)
-    seglast = self.segment(segpath[-1].segment)
-    seglast_d = seglast.dovetails_of_end(segpath[-1].end_type)
-    redundant_last = (len(seglast_d) > 0)
-    if len(seglast_d) == 1:
-      segpath.append(seglast_d[0].other_end(segpath[-1].inverted()))
+    last_d = self.segment(segpath[-1].segment).dovetails_of_end(
+               segpath[-1].end_type)
+    redundant_last = (len(last_d) > 1)
+    if len(last_d) == 1:
+      junction = last_d[0].other_end(segpath[-1])
+      if self.__is_junction_end(junction) and junction.name not in names:
+        segpath.append(junction.inverted())
+        redundant_last = True
     segpath.append(redundant_last)
 
+  def __is_junction_end(self, segment_end):
+    return len(self.segment(segment_end.segment).dovetails_of_end(
+                 segment_end.end_type)) > 1
+
   def _link_duplicated_first(self, merged, first, is_reversed, jntag):
     # annotate junction
     if jntag is None:
@@ -41,22 +67,29 @@ class RedundantLinearPaths:
     else:
       first.get(jntag)["R"].append([merged.name, "+"])
     # create temporary link
-    ln = len(first.sequence)
     if self._version == "gfa1":
-      tmp_link = gfapy.line.edge.Link([first.name, \
-        "-" if is_reversed else "+", merged.name, "+", \
-        "{}M".format(ln), "co:Z:temporary"])
-      self.add_line(tmp_link)
+      self.__link_duplicated_first_GFA1(merged, first, is_reversed)
     elif self._version == "gfa2":
-      tmp_link = gfapy.line.edge.GFA2(["*",first.name + \
-        ("-" if is_reversed else "+"), merged.name+"+",
-        "0" if is_reversed else str(ln-1), # on purpose fake
-        "1" if is_reversed else "{}$".format(ln), # on purpose fake
-        0, str(ln), "{}M".format(ln), "co:Z:temporary"])
-      self.add_line(tmp_link)
+      self.__link_duplicated_first_GFA2(merged, first, is_reversed)
     else:
       raise gfapy.AssertionError()
 
+  def __link_duplicated_first_GFA1(self, merged, first, is_reversed):
+    tmp_link = gfapy.line.edge.Link(["L", first.name, \
+      "-" if is_reversed else "+", merged.name, "+", \
+      self.__overlap_GFA1(first), "co:Z:temporary"])
+    self.add_line(tmp_link)
+
+  def __link_duplicated_first_GFA2(self, merged, first, is_reversed):
+    ln = first.length
+    ln_s = str(ln)
+    tmp_link = gfapy.line.edge.GFA2(["E", "*",first.name + \
+      ("-" if is_reversed else "+"), merged.name+"+",
+      "0" if is_reversed else str(ln-1), # on purpose fake
+      "1" if is_reversed else ln_s+"$", # on purpose fake
+      0, ln_s, ln_s+"M", "co:Z:temporary"])
+    self.add_line(tmp_link)
+
   def _link_duplicated_last(self, merged, last, is_reversed, jntag):
     # annotate junction
     if jntag is None:
@@ -68,49 +101,79 @@ class RedundantLinearPaths:
     else:
       last.get(jntag)["L"].append([merged.name, "+"])
     # create temporary link
-    ln = len(last.sequence)
     if self._version == "gfa1":
-      tmp_link = gfapy.line.edge.Link([merged.name, "+",
-          last.name, "-" if is_reversed else "+",
-          "{}M".format(ln), "co:Z:temporary"])
-      self.add_line(tmp_link)
+      self.__link_duplicated_last_GFA1(merged, last, is_reversed)
     elif self._version == "gfa2":
-      mln = len(merged.sequence)
-      tmp_link = gfapy.line.edge.GFA2(["*",merged.name+"+", \
-        last.name+("-" if is_reversed else "+"),
-        str(mln - ln), "{}$".format(mln),
-        str(ln-1) if is_reversed else "0", # on purpose fake
-        "{}$".format(ln) if is_reversed else "1", # on purpose fake
-        "{}M".format(ln), "co:Z:temporary"])
-      self.add_line(tmp_link)
+      self.__link_duplicated_last_GFA2(merged, last, is_reversed)
     else:
       raise gfapy.AssertionError()
 
+  def __link_duplicated_last_GFA1(self, merged, last, is_reversed):
+    tmp_link = gfapy.line.edge.Link(["L", merged.name, "+",
+        last.name, "-" if is_reversed else "+",
+        self.__overlap_GFA1(last), "co:Z:temporary"])
+    self.add_line(tmp_link)
+
+  def __link_duplicated_last_GFA2(self, merged, last, is_reversed):
+    ln = last.length
+    ln_s = str(ln)
+    mln = merged.length
+    tmp_link = gfapy.line.edge.GFA2(["E", "*",merged.name+"+", \
+      last.name+("-" if is_reversed else "+"),
+      str(mln - ln), str(mln)+"$",
+      str(ln-1) if is_reversed else "0", # on purpose fake
+      ln_s+"$" if is_reversed else "1", # on purpose fake
+      ln_s+"M", "co:Z:temporary"])
+    self.add_line(tmp_link)
+
+  @staticmethod
+  def __overlap_GFA1(junction):
+    # the merged segments overlap each other and the junction over the
+    # whole junction sequence
+    ln = junction.length
+    return "*" if ln is None else str(ln)+"M"
+
   def _remove_junctions(self, jntag):
     if jntag is None:
       jntag = "jn"
     for s in self.segments:
       jndata = s.get(jntag)
       if jndata:
-        ln = len(s.sequence)
-        for m1, dir1 in jndata["L"].items():
-          for m2, dir2 in jndata["R"].items():
-            if self._version == "gfa1":
-              l = gfapy.line.edge.Link([m1,dir1,m2,dir2,"{}M".format(ln)])
-              self.add_line(l)
-            elif self._version == "gfa2":
-              m1ln = len(self.segment(m1).sequence)
-              m2ln = len(self.segment(m2).sequence)
-              r1 = (dir1 == "-")
-              r2 = (dir2 == "-")
-              l = gfapy.line.edge.GFA2(["*", m1+dir1, m2+dir2,
-                 "0" if r1 else str(m1ln-ln),
-                 str(ln) if r1 else str(m1ln)+"$",
-                 "0" if r2 else str(m2ln-ln),
-                 str(ln) if r1 else str(m2ln)+"$",
-                 str(ln)+"M"])
-              self.add_line(l)
-            else:
-              raise gfapy.AssertionError()
+        if self._version == "gfa1":
+          self.__link_junction_GFA1(s, jndata)
+        elif self._version == "gfa2":
+          self.__link_junction_GFA2(s, jndata)
+        else:
+          raise gfapy.AssertionError()
         s.disconnect()
 
+  def __link_junction_GFA1(self, s, jndata):
+    overlap = self.__overlap_GFA1(s)
+    for m1, dir1 in jndata["L"]:
+      for m2, dir2 in jndata["R"]:
+        l = gfapy.line.edge.Link(["L", m1,dir1,m2,dir2,overlap])
+        self.add_line(l)
+
+  def __link_junction_GFA2(self, s, jndata):
+    ln = s.length
+    ln_s = str(ln)
+    overlap = ln_s+"M"
+    # the fields of each merged segment are computed only once, outside
+    # of the loop over the pairs of merged segments
+    to_fields = []
+    for m2, dir2 in jndata["R"]:
+      if dir2 == "+":
+        to_fields.append((m2+dir2, "0", ln_s))
+      else:
+        m2ln = self.segment(m2).length
+        to_fields.append((m2+dir2, str(m2ln-ln), str(m2ln)+"$"))
+    for m1, dir1 in jndata["L"]:
+      if dir1 == "-":
+        beg1, end1 = "0", ln_s
+      else:
+        m1ln = self.segment(m1).length
+        beg1, end1 = str(m1ln-ln), str(m1ln)+"$"
+      for sid2, beg2, end2 in to_fields:
+        l = gfapy.line.edge.GFA2(["E", "*", m1+dir1, sid2,
+           beg1, end1, beg2, end2, overlap])
+        self.add_line(l)
@@ -1,5 +1,17 @@
 import gfapy
-import re
+import sys
+from gfapy.field.printable import PRINTABLE, only_chars
+
+# the end types are stored as the interned strings, so that they can be
+# compared by identity
+_L = sys.intern("L")
+_R = sys.intern("R")
+_END_TYPES = {"L": _L, "R": _R}
+
+def _interned_end_type(value):
+  if isinstance(value, str):
+    return _END_TYPES.get(value, value)
+  return value
 
 class SegmentEnd:
   """A segment plus an end type (L or R).
@@ -22,6 +34,8 @@ class SegmentEnd:
       end symbol the second
   """
 
+  __slots__ = ("__segment", "__end_type", "__name")
+
   def __new__(cls, *args):
     if isinstance(args[0], SegmentEnd):
       return args[0]
@@ -35,21 +49,30 @@ class SegmentEnd:
         return
       elif isinstance(args[0], str):
         self.__segment = args[0][0:-1]
-        self.__end_type = args[0][-1]
+        self.__end_type = _interned_end_type(args[0][-1])
       elif isinstance(args[0], list):
         if len(args[0]) != 2:
           raise gfapy.ArgumentError("Cannot create a SegmentEnd "+
             " from a list of size {}".format(len(args[0])))
         self.__segment = args[0][0]
-        self.__end_type = args[0][1]
+        self.__end_type = _interned_end_type(args[0][1])
       else:
         raise gfapy.ArgumentError("Cannot create an SegmentEnd "+
             " from an object of type {}".format(type(args[0])))
     elif len(args) == 2:
       self.__segment = args[0]
-      self.__end_type = args[1]
+      self.__end_type = _interned_end_type(args[1])
     else:
       raise gfapy.ArgumentError("Wrong number of arguments for SegmentEnd()")
+    self.__cache_name()
+
+  def __cache_name(self):
+    # the name of a line can change (e.g. if it is renamed), thus it is
+    # only cached if the segment is a string
+    if isinstance(self.__segment, gfapy.Line):
+      self.__name = None
+    else:
+      self.__name = str(self.__segment)
 
   def validate(self):
     """Validate the content of the instance
@@ -67,20 +90,21 @@ class SegmentEnd:
     return None
 
   def __validate_end_type(self):
-    if not self.__end_type in ["L", "R"]:
+    if self.__end_type is not _L and self.__end_type is not _R:
       raise gfapy.ValueError(
           "Invalid end type ({})".format(repr(self.__end_type)))
 
   def __validate_segment(self):
-    if isinstance(self.segment, gfapy.line.Segment):
-      string = self.segment.name
-    elif isinstance(self.segment, str):
-      string = self.segment
+    segment = self.__segment
+    if isinstance(segment, str):
+      string = segment
+    elif isinstance(segment, gfapy.line.Segment):
+      string = segment.name
     else:
       raise gfapy.TypeError(
         "Invalid class ({}) for segment reference ({})"
-        .format(self.segment.__class__, self.segment))
-    if not re.match(r"^[!-~]+$", string):
+        .format(segment.__class__, segment))
+    if not only_chars(string, PRINTABLE):
       raise gfapy.FormatError(
       "{} is not a valid segment identifier\n".format(repr(string))+
       "(it contains spaces or non-printable characters)")
@@ -97,6 +121,7 @@ class SegmentEnd:
   @segment.setter
   def segment(self, value):
     self.__segment=value
+    self.__cache_name()
 
   @property
   def name(self):
@@ -106,10 +131,9 @@ class SegmentEnd:
       str : if segment is a string, then segment; if it is a segment instance,
             then segment.name
     """
-    if isinstance(self.__segment, gfapy.Line):
+    if self.__name is None:
       return self.__segment.name
-    else:
-      return str(self.__segment)
+    return self.__name
 
   @property
   def end_type(self):
@@ -122,10 +146,23 @@ class SegmentEnd:
 
   @end_type.setter
   def end_type(self, value):
-    self.__end_type = value
+    self.__end_type = _interned_end_type(value)
 
   def inverted(self):
-    return SegmentEnd(self.__segment, gfapy.invert(self.end_type))
+    end_type = self.__end_type
+    if end_type is _L:
+      end_type = _R
+    elif end_type is _R:
+      end_type = _L
+    else:
+      end_type = gfapy.invert(end_type)
+    # skip the argument parsing of the constructor, as the segment and
+    # its name are the same as in self
+    new_instance = object.__new__(SegmentEnd)
+    new_instance.__segment = self.__segment
+    new_instance.__end_type = end_type
+    new_instance.__name = self.__name
+    return new_instance
 
   def __str__(self):
     return "{}{}".format(self.name, self.end_type)
@@ -143,5 +180,12 @@ class SegmentEnd:
       return False
     return (self.name == other.name) and (self.end_type == other.end_type)
 
+  def __hash__(self):
+    # consistent with the equality to the string representation
+    return hash(self.name + str(self.__end_type))
+
+  def __reduce__(self):
+    return (SegmentEnd, (self.__segment, self.__end_type))
+
   def __getattr__(self, name):
     return getattr(self.__segment, name)
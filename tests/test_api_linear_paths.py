@@ -47,3 +47,83 @@ class TestAPILinearPaths(unittest.TestCase):
         lps.add(" ".join([s.name for s in lp]))
       self.assertEqual({"1 19 18", "11 9 12", "22 16 20 21 23"}, lps)
 
+  def check_redundant_junctions(self, fileid, segments, edges1, edges2):
+    for sfx, edges in [("gfa", edges1), ("gfa2", edges2)]:
+      gfa = gfapy.Gfa.from_file(
+          "tests/testdata/redundant_junctions.{}.{}".format(fileid, sfx))
+      gfa.merge_linear_paths(redundant_junctions=True)
+      self.assertEqual(segments,
+          {s.name: s.sequence for s in gfa.segments})
+      self.assertEqual(edges, {str(e) for e in gfa.dovetails})
+
+  def test_merge_redundant_junctions_fork(self):
+    # x+ -> a+; a+ -> b-; a+ -> c+
+    self.check_redundant_junctions(1,
+        {"x_a": "TTTTTACGTACG", "b_a": "TTTTTCGTACGT", "a_c": "ACGTACGCCCCC"},
+        {"L\tx_a\t+\tb_a\t-\t7M", "L\tx_a\t+\ta_c\t+\t7M"},
+        {"E\t*\tx_a+\tb_a-\t5\t12$\t5\t12$\t7M",
+         "E\t*\tx_a+\ta_c+\t5\t12$\t0\t7\t7M"})
+
+  def test_merge_redundant_junctions_repeat(self):
+    # a+ -> j+; b+ -> j+; j+ -> c+; j+ -> d+
+    self.check_redundant_junctions(2,
+        {"a_j": "AAAAAACTTTTTTTG", "b_j": "GGGGGACTTTTTTTG",
+         "j_c": "ACTTTTTTTGCCCCC", "j_d": "ACTTTTTTTGAAAAA"},
+        {"L\ta_j\t+\tj_c\t+\t10M", "L\ta_j\t+\tj_d\t+\t10M",
+         "L\tb_j\t+\tj_c\t+\t10M", "L\tb_j\t+\tj_d\t+\t10M"},
+        {"E\t*\ta_j+\tj_c+\t5\t15$\t0\t10\t10M",
+         "E\t*\ta_j+\tj_d+\t5\t15$\t0\t10\t10M",
+         "E\t*\tb_j+\tj_c+\t5\t15$\t0\t10\t10M",
+         "E\t*\tb_j+\tj_d+\t5\t15$\t0\t10\t10M"})
+
+  def test_merge_redundant_junctions_branch(self):
+    # a+ -> b+; a+ -> c+; b+ -> d+; d+ -> e+
+    self.check_redundant_junctions(3,
+        {"a_b_d_e": "ACGTACGAAAATGGGGCTTTT", "a_c": "ACGTACGCCCCC"},
+        set(), set())
+
+  def test_merge_redundant_junctions_junction_to_junction(self):
+    # t+ -> u+; u+ -> v+; u+ -> w+; z+ -> v+; v+ -> y+
+    self.check_redundant_junctions(4,
+        {"t_u": "TTTTTACGGGCA", "u_v": "ACGGGCATTTGA", "u_w": "ACGGGCAGGGGG",
+         "z_v": "AAAAACATTTGA", "v_y": "CATTTGACCCCC"},
+        {"L\tt_u\t+\tu_v\t+\t7M", "L\tt_u\t+\tu_w\t+\t7M",
+         "L\tu_v\t+\tv_y\t+\t7M", "L\tz_v\t+\tv_y\t+\t7M"},
+        {"E\t*\tt_u+\tu_v+\t5\t12$\t0\t7\t7M",
+         "E\t*\tt_u+\tu_w+\t5\t12$\t0\t7\t7M",
+         "E\t*\tu_v+\tv_y+\t5\t12$\t0\t7\t7M",
+         "E\t*\tz_v+\tv_y+\t5\t12$\t0\t7\t7M"})
+
+  def test_merge_redundant_junctions_placeholders(self):
+    for sfx in ["gfa", "gfa2"]:
+      gfa = gfapy.Gfa.from_file("tests/testdata/linear_merging.4."+sfx)
+      gfa.merge_linear_paths(redundant_junctions=True)
+      self.assertEqual({"0_2": 19, "0_1_2": 28, "2_3": 19},
+          {s.name: s.length for s in gfa.segments})
+      self.assertEqual({("0_2", "0_1_2"), ("2_3", "0_1_2")},
+          {(e.from_segment.name, e.to_segment.name) for e in gfa.dovetails})
+
+  def test_merge_redundant_junctions_circular(self):
+    # 2-segment cycle: no junction, the circular link is kept
+    gfa = gfapy.Gfa(["S\ta\tACGTT", "S\tb\tTTACG",
+                     "L\ta\t+\tb\t+\t2M", "L\tb\t+\ta\t+\t2M"])
+    gfa.merge_linear_paths(redundant_junctions=True)
+    self.assertEqual({"b_a": "TTACGGTT"},
+        {s.name: s.sequence for s in gfa.segments})
+    self.assertEqual({"L\tb_a\t+\tb_a\t+\t2M"},
+        {str(e) for e in gfa.dovetails})
+    # single-segment self-loops: nothing to merge
+    gfa = gfapy.Gfa.from_file("tests/testdata/loop.gfa")
+    lines = {str(l) for l in gfa.segments + gfa.dovetails}
+    gfa.merge_linear_paths(redundant_junctions=True)
+    self.assertEqual(lines, {str(l) for l in gfa.segments + gfa.dovetails})
+
+  def test_merge_redundant_junctions_placeholder_junction(self):
+    for sfx in ["gfa1", "gfa2"]:
+      gfa = gfapy.Gfa.from_file(
+          "tests/testdata/all_line_types.{}.gfa".format(sfx))
+      gfa.merge_linear_paths(redundant_junctions=True)
+      self.assertEqual({"1_2", "1_3", "11_12", "11_13", "4", "5", "6"},
+          set(gfa.segment_names))
+      for sn in ["1_2", "1_3", "11_12", "11_13"]:
+        self.assertTrue(gfapy.is_placeholder(gfa.segment(sn).sequence))
@@ -40,3 +40,29 @@ class TestInternalsFieldValidator(unittest.TestCase):
     gfapy.Field._validate_gfa_field("{\"1\":2}", "J")
     with self.assertRaises(gfapy.FormatError):
       gfapy.Field._validate_gfa_field("1\t2", "J")
+
+  def test_field_gfa_field_validate_identifier_list_gfa2(self):
+    gfapy.Field._validate_gfa_field("a b c", "identifier_list_gfa2")
+    gfapy.Field._validate_gfa_field(["a", "b", "c"], "identifier_list_gfa2")
+    gfapy.Field._validate_gfa_field(["a", gfapy.Line("S\tb\t*")],
+                                    "identifier_list_gfa2")
+    with self.assertRaises(gfapy.FormatError):
+      gfapy.Field._validate_gfa_field("a\tb", "identifier_list_gfa2")
+    with self.assertRaises(gfapy.FormatError):
+      gfapy.Field._validate_gfa_field(["a", "b c"], "identifier_list_gfa2")
+    with self.assertRaises(gfapy.FormatError):
+      gfapy.Field._validate_gfa_field(["a", ""], "identifier_list_gfa2")
+    with self.assertRaises(gfapy.TypeError):
+      gfapy.Field._validate_gfa_field(["a", 1], "identifier_list_gfa2")
+
+  def test_field_gfa_field_validate_parsed_identifier_list_gfa2(self):
+    lst = gfapy.Field._parse_gfa_field("a b", "identifier_list_gfa2")
+    self.assertEqual(["a", "b"], lst)
+    gfapy.Field._validate_gfa_field(lst, "identifier_list_gfa2")
+    lst.append("c d")
+    with self.assertRaises(gfapy.FormatError):
+      gfapy.Field._validate_gfa_field(lst, "identifier_list_gfa2")
+    # consecutive spaces are parsed to an empty identifier
+    lst = gfapy.Field._parse_gfa_field("a  b", "identifier_list_gfa2")
+    with self.assertRaises(gfapy.FormatError):
+      gfapy.Field._validate_gfa_field(lst, "identifier_list_gfa2")
@@ -1,4 +1,6 @@
 import unittest
+import copy
+import pickle
 import gfapy
 
 class TestUnitSegmentEnd(unittest.TestCase):
@@ -76,6 +78,23 @@ class TestUnitSegmentEnd(unittest.TestCase):
     assert(TestUnitSegmentEnd.se_s == ["a","L"])
     assert(TestUnitSegmentEnd.se_r == ["a","R"])
 
+  def test_hash(self):
+    se2 = gfapy.SegmentEnd(TestUnitSegmentEnd.sym, "L")
+    self.assertEqual(hash(TestUnitSegmentEnd.se_s), hash(se2))
+    self.assertEqual(hash(TestUnitSegmentEnd.se_s_str),
+                     hash(TestUnitSegmentEnd.se_s))
+    s = {TestUnitSegmentEnd.se_s, TestUnitSegmentEnd.se_r,
+         TestUnitSegmentEnd.se_r.inverted()}
+    self.assertEqual(2, len(s))
+    assert(se2 in s)
+
+  def test_copy(self):
+    se2 = copy.copy(TestUnitSegmentEnd.se_s)
+    self.assertEqual(TestUnitSegmentEnd.se_s, se2)
+    se3 = pickle.loads(pickle.dumps(TestUnitSegmentEnd.se_s))
+    self.assertEqual(TestUnitSegmentEnd.se_s, se3)
+    self.assertEqual("L", se3.end_type)
+
   #def test_comparison(self):
   #  self.assertEqual(-1, ["a","L"].to_segment_end() <=> ["b","L"].to_segment_end())
   #  self.assertEqual(0,  ["a","L"].to_segment_end() <=> ["a","L"].to_segment_end())